@@ -0,0 +1,8 @@
+"""
+Pytest configuration for Kivg.
+"""
+
+# The demo scripts are named test_*.py but are runnable demos, not tests.
+# Collecting them imports optional GUI/FFmpeg dependencies and re-runs
+# conversion work outside the test suite.
+collect_ignore = ["demo"]
@@ -5,6 +5,15 @@ Pure Python implementation without Kivy dependency.
 
 from math import sqrt, cos, sin, pi
 
+# Constants shared by the easing functions, computed once at import time
+_HALF_PI = pi / 2.0
+_BACK_S = 1.70158
+_BACK_S_IN_OUT = 1.70158 * 1.525
+_ELASTIC_S = 0.3 / 4.0
+_ELASTIC_W = (2 * pi) / 0.3
+_ELASTIC_S_IN_OUT = 0.3 * 1.5 / 4.0
+_ELASTIC_W_IN_OUT = (2.0 * pi) / (0.3 * 1.5)
+
 
 class AnimationTransition:
     """
@@ -101,12 +110,12 @@ class AnimationTransition:
     @staticmethod
     def in_sine(progress: float) -> float:
         """Sinusoidal ease-in."""
-        return -1.0 * cos(progress * (pi / 2.0)) + 1.0
+        return -1.0 * cos(progress * _HALF_PI) + 1.0
 
     @staticmethod
     def out_sine(progress: float) -> float:
         """Sinusoidal ease-out."""
-        return sin(progress * (pi / 2.0))
+        return sin(progress * _HALF_PI)
 
     @staticmethod
     def in_out_sine(progress: float) -> float:
@@ -163,55 +172,55 @@ class AnimationTransition:
     @staticmethod
     def in_elastic(progress: float) -> float:
         """Elastic ease-in."""
-        p = 0.3
-        s = p / 4.0
         q = progress
         if q == 1:
             return 1.0
         q -= 1.0
-        return -(pow(2, 10 * q) * sin((q - s) * (2 * pi) / p))
+        return -(pow(2, 10 * q) * sin((q - _ELASTIC_S) * _ELASTIC_W))
 
     @staticmethod
     def out_elastic(progress: float) -> float:
         """Elastic ease-out."""
-        p = 0.3
-        s = p / 4.0
         q = progress
         if q == 1:
             return 1.0
-        return pow(2, -10 * q) * sin((q - s) * (2 * pi) / p) + 1.0
+        return pow(2, -10 * q) * sin((q - _ELASTIC_S) * _ELASTIC_W) + 1.0
 
     @staticmethod
     def in_out_elastic(progress: float) -> float:
         """Elastic ease-in-out."""
-        p = 0.3 * 1.5
-        s = p / 4.0
         q = progress * 2
         if q == 2:
             return 1.0
         if q < 1:
             q -= 1.0
-            return -0.5 * (pow(2, 10 * q) * sin((q - s) * (2.0 * pi) / p))
+            return -0.5 * (
+                pow(2, 10 * q) * sin((q - _ELASTIC_S_IN_OUT) * _ELASTIC_W_IN_OUT)
+            )
         else:
             q -= 1.0
-            return pow(2, -10 * q) * sin((q - s) * (2.0 * pi) / p) * 0.5 + 1.0
+            return (
+                pow(2, -10 * q) * sin((q - _ELASTIC_S_IN_OUT) * _ELASTIC_W_IN_OUT)
+                * 0.5
+                + 1.0
+            )
 
     @staticmethod
     def in_back(progress: float) -> float:
         """Back ease-in (overshoot)."""
-        return progress * progress * ((1.70158 + 1.0) * progress - 1.70158)
+        return progress * progress * ((_BACK_S + 1.0) * progress - _BACK_S)
 
     @staticmethod
     def out_back(progress: float) -> float:
         """Back ease-out (overshoot)."""
         p = progress - 1.0
-        return p * p * ((1.70158 + 1) * p + 1.70158) + 1.0
+        return p * p * ((_BACK_S + 1) * p + _BACK_S) + 1.0
 
     @staticmethod
     def in_out_back(progress: float) -> float:
         """Back ease-in-out (overshoot)."""
         p = progress * 2.0
-        s = 1.70158 * 1.525
+        s = _BACK_S_IN_OUT
         if p < 1:
             return 0.5 * (p * p * ((s + 1.0) * p - s))
         p -= 2.0
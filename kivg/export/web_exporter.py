@@ -9,6 +9,57 @@ import json
 # Default stroke dash length for animations (should be larger than any path length)
 DEFAULT_DASH_LENGTH = 10000
 
+# Static parts of the JavaScript animation, kept out of the per-call f-string
+_JS_EASINGS = """    // Easing functions
+    const easings = {
+      linear: t => t,
+      easeInQuad: t => t * t,
+      easeOutQuad: t => t * (2 - t),
+      easeInOutQuad: t => t < 0.5 ? 2 * t * t : -1 + (4 - 2 * t) * t,
+      easeOutBounce: t => {
+        if (t < 1/2.75) return 7.5625 * t * t;
+        if (t < 2/2.75) { t -= 1.5/2.75; return 7.5625 * t * t + 0.75; }
+        if (t < 2.5/2.75) { t -= 2.25/2.75; return 7.5625 * t * t + 0.9375; }
+        t -= 2.625/2.75;
+        return 7.5625 * t * t + 0.984375;
+      }
+    };"""
+
+_JS_ANIMATE_PATHS = """    function animatePaths() {
+      const paths = pathConfigs.map(config => {
+        const path = document.getElementById(config.id);
+        const length = path.getTotalLength();
+        path.style.strokeDasharray = length;
+        path.style.strokeDashoffset = length;
+        return { path, length, fill: config.fill };
+      });
+      
+      const startTime = performance.now();
+      
+      function animate(currentTime) {
+        const elapsed = currentTime - startTime;
+        const progress = Math.min(elapsed / duration, 1);
+        const easedProgress = easing(progress);
+        
+        paths.forEach(({ path, length, fill }) => {
+          path.style.strokeDashoffset = length * (1 - easedProgress);
+          
+          if (progress >= 1 && fill !== 'none') {
+            path.style.fill = fill;
+          }
+        });
+        
+        if (progress < 1) {
+          requestAnimationFrame(animate);
+        }
+      }
+      
+      requestAnimationFrame(animate);
+    }
+    
+    // Start animation when page loads
+    window.addEventListener('load', animatePaths);"""
+
 
 class WebAnimationExporter:
     """
@@ -62,6 +113,10 @@ class WebAnimationExporter:
 
         dash_len = dash_length or DEFAULT_DASH_LENGTH
 
+        # Attributes and timing shared by every path, formatted once
+        stroke_attrs = f'stroke="{stroke_color}" stroke-width="{stroke_width}"'
+        delay_step = duration / len(svg_paths)
+
         # Generate unique IDs for each path
         path_elements = []
         css_rules = []
@@ -74,12 +129,11 @@ class WebAnimationExporter:
             # Path element
             path_elements.append(
                 f'    <path id="{path_id}" d="{d}" '
-                f'fill="{path_fill}" stroke="{stroke_color}" '
-                f'stroke-width="{stroke_width}" class="animate-path" />'
+                f'fill="{path_fill}" {stroke_attrs} class="animate-path" />'
             )
 
             # Delay each path slightly for sequential animation
-            delay = i * (duration / len(svg_paths))
+            delay = i * delay_step
             css_rules.append(
                 f"""
   #{path_id} {{
@@ -165,6 +219,9 @@ class WebAnimationExporter:
         if not svg_paths:
             return self._generate_empty_html()
 
+        # Attributes shared by every path, formatted once
+        stroke_attrs = f'stroke="{stroke_color}" stroke-width="{stroke_width}"'
+
         # Generate path elements
         path_elements = []
         path_configs = []
@@ -175,12 +232,10 @@ class WebAnimationExporter:
             path_fill = path_data.get("fill", "#ffffff") if fill else "none"
 
             path_elements.append(
-                f'    <path id="{path_id}" d="{d}" '
-                f'fill="none" stroke="{stroke_color}" '
-                f'stroke-width="{stroke_width}" />'
+                f'    <path id="{path_id}" d="{d}" fill="none" {stroke_attrs} />'
             )
 
-            path_configs.append({"id": path_id, "fill": path_fill if fill else "none"})
+            path_configs.append({"id": path_id, "fill": path_fill})
 
         paths_str = "\n".join(path_elements)
         config_json = json.dumps(path_configs)
@@ -206,57 +261,11 @@ class WebAnimationExporter:
     const pathConfigs = {config_json};
     const duration = {duration_ms};
     
-    // Easing functions
-    const easings = {{
-      linear: t => t,
-      easeInQuad: t => t * t,
-      easeOutQuad: t => t * (2 - t),
-      easeInOutQuad: t => t < 0.5 ? 2 * t * t : -1 + (4 - 2 * t) * t,
-      easeOutBounce: t => {{
-        if (t < 1/2.75) return 7.5625 * t * t;
-        if (t < 2/2.75) {{ t -= 1.5/2.75; return 7.5625 * t * t + 0.75; }}
-        if (t < 2.5/2.75) {{ t -= 2.25/2.75; return 7.5625 * t * t + 0.9375; }}
-        t -= 2.625/2.75;
-        return 7.5625 * t * t + 0.984375;
-      }}
-    }};
+{_JS_EASINGS}
     
     const easing = easings['{easing}'] || easings.easeOutQuad;
     
-    function animatePaths() {{
-      const paths = pathConfigs.map(config => {{
-        const path = document.getElementById(config.id);
-        const length = path.getTotalLength();
-        path.style.strokeDasharray = length;
-        path.style.strokeDashoffset = length;
-        return {{ path, length, fill: config.fill }};
-      }});
-      
-      const startTime = performance.now();
-      
-      function animate(currentTime) {{
-        const elapsed = currentTime - startTime;
-        const progress = Math.min(elapsed / duration, 1);
-        const easedProgress = easing(progress);
-        
-        paths.forEach(({{ path, length, fill }}) => {{
-          path.style.strokeDashoffset = length * (1 - easedProgress);
-          
-          if (progress >= 1 && fill !== 'none') {{
-            path.style.fill = fill;
-          }}
-        }});
-        
-        if (progress < 1) {{
-          requestAnimationFrame(animate);
-        }}
-      }}
-      
-      requestAnimationFrame(animate);
-    }}
-    
-    // Start animation when page loads
-    window.addEventListener('load', animatePaths);
+{_JS_ANIMATE_PATHS}
   </script>
 </body>
 </html>"""
@@ -298,12 +307,13 @@ class WebAnimationExporter:
 </svg>"""
 
         dash_len = dash_length or DEFAULT_DASH_LENGTH
+        delay_step = duration / len(svg_paths)
         path_elements = []
 
         for i, path_data in enumerate(svg_paths):
             d = path_data.get("d", "")
             path_fill = path_data.get("fill", "#ffffff") if fill else "none"
-            delay = i * (duration / len(svg_paths))
+            delay = i * delay_step
 
             path_elements.append(
                 f"""  <path d="{d}" 
@@ -3,8 +3,8 @@ Kivg - SVG drawing and animation
 Core class and main API (Kivy-free implementation)
 """
 
-from collections import OrderedDict
-from typing import List, Tuple, Dict, Any, Callable, Optional
+import os
+from typing import IO, List, Tuple, Dict, Any, Callable, Optional, Union
 
 from .svg_parser import parse_svg
 from .path_utils import get_all_points, bezier_points, line_points
@@ -25,6 +25,26 @@ class SVGAnimator:
     # Default stroke dash length for animations (should be larger than any path length)
     DEFAULT_DASH_LENGTH = 10000
 
+    __slots__ = (
+        "width",
+        "height",
+        "_fill",
+        "_line_width",
+        "_line_color",
+        "_animation_duration",
+        "svg_size",
+        "closed_shapes",
+        "path",
+        "current_svg_file",
+        "_previous_svg_file",
+        "_previous_svg_stat",
+        "_previous_svg_parse",
+        "_video_exporter",
+        "_web_exporter",
+        # Keep instances weak-referenceable, as they were before __slots__
+        "__weakref__",
+    )
+
     def __init__(self, width: int = 800, height: int = 600):
         """
         Initialize the SVG animator.
@@ -42,9 +62,12 @@ class SVGAnimator:
 
         # Parsed data
         self.svg_size = []
-        self.closed_shapes = OrderedDict()
+        self.closed_shapes = {}
         self.path = []
         self.current_svg_file = ""
+        self._previous_svg_file = None
+        self._previous_svg_stat = None
+        self._previous_svg_parse = None
 
         # Exporters
         self._video_exporter = None
@@ -64,37 +87,63 @@ class SVGAnimator:
             self._web_exporter = WebAnimationExporter(self.width, self.height)
         return self._web_exporter
 
-    def load_svg(self, svg_file: str) -> Dict[str, Any]:
+    def load_svg(self, svg_file: Union[str, IO]) -> Dict[str, Any]:
         """
         Load and parse an SVG file.
 
         Args:
-            svg_file: Path to the SVG file
+            svg_file: Path to the SVG file, or a file-like object with SVG content
 
         Returns:
             Dictionary with parsed SVG data
         """
+        # Identify the file version by nanosecond mtime and size, so a rewrite
+        # within a coarse timestamp tick is still detected
+        file_stat = None
+        if not hasattr(svg_file, "read"):
+            try:
+                st = os.stat(svg_file)
+                file_stat = (st.st_mtime_ns, st.st_size)
+            except OSError:
+                pass
+
+        # Reuse the previous XML parse if the same file is loaded again
+        # unchanged; the shapes are always rebuilt so callers get fresh data
+        if (
+            file_stat is not None
+            and svg_file == self._previous_svg_file
+            and file_stat == self._previous_svg_stat
+        ):
+            svg_size, path_strings = self._previous_svg_parse
+        else:
+            svg_size, path_strings = parse_svg(svg_file)
+            self._previous_svg_file = svg_file
+            self._previous_svg_stat = file_stat
+            self._previous_svg_parse = (svg_size, path_strings)
+
         self.current_svg_file = svg_file
-        self.svg_size, path_strings = parse_svg(svg_file)
+        self.svg_size = list(svg_size)
 
         self.path = []
-        self.closed_shapes = OrderedDict()
+        self.closed_shapes = {}
 
         for path_string, id_, clr in path_strings:
             move_found = False
             tmp = []
-            self.closed_shapes[id_] = dict()
-            self.closed_shapes[id_][id_ + "paths"] = []
-            self.closed_shapes[id_][id_ + "shapes"] = []
-            self.closed_shapes[id_]["color"] = clr
-            self.closed_shapes[id_]["d"] = path_string
+            shape_paths = []
+            self.closed_shapes[id_] = {
+                id_ + "paths": shape_paths,
+                id_ + "shapes": [],
+                "color": list(clr),
+                "d": path_string,
+            }
 
             _path = parse_path(path_string)
             for e in _path:
                 self.path.append(e)
 
                 if isinstance(e, Close) or (isinstance(e, Move) and move_found):
-                    self.closed_shapes[id_][id_ + "paths"].append(tmp)
+                    shape_paths.append(tmp)
                     move_found = False
 
                 if isinstance(e, Move):
@@ -167,8 +216,9 @@ class SVGAnimator:
         else:
             raise ValueError(f"Unknown animation method: {method}")
 
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write(html)
+        # Encode once and write bytes, skipping the text-mode codec layer
+        with open(output_file, "wb") as f:
+            f.write(html.encode("utf-8"))
 
         return output_file
 
@@ -201,32 +251,31 @@ class SVGAnimator:
         frames = []
         dash_len = dash_length or self.DEFAULT_DASH_LENGTH
 
-        for frame_idx in range(num_frames):
-            progress = frame_idx / max(num_frames - 1, 1)
-
-            # Generate SVG for this frame
-            path_elements = []
-            for path_data in paths:
-                d = path_data.get("d", "")
-                path_fill = path_data.get("fill", "#ffffff") if fill else "none"
+        # Only the dash offset changes between frames, so the path markup is
+        # built once and the shared stroke attributes are set on an enclosing
+        # group
+        path_elements = []
+        for path_data in paths:
+            d = path_data.get("d", "")
+            path_fill = path_data.get("fill", "#ffffff") if fill else "none"
+            path_elements.append(f'    <path d="{d}" fill="{path_fill}" />')
 
-                # Simple dash animation simulation
-                dash_offset = dash_len * (1 - progress)
+        paths_str = "\n".join(path_elements)
 
-                path_elements.append(
-                    f'  <path d="{d}" fill="{path_fill}" '
-                    f'stroke="{stroke_color}" stroke-width="{stroke_width}" '
-                    f'stroke-dasharray="{dash_len}" stroke-dashoffset="{dash_offset:.2f}" />'
-                )
+        for frame_idx in range(num_frames):
+            progress = frame_idx / max(num_frames - 1, 1)
 
-            paths_str = "\n".join(path_elements)
+            # Simple dash animation simulation
+            dash_offset = dash_len * (1 - progress)
 
             svg = f"""<?xml version="1.0" encoding="UTF-8"?>
 <svg xmlns="http://www.w3.org/2000/svg" 
      width="{self.width}" height="{self.height}" 
      viewBox="0 0 {self.svg_size[0]} {self.svg_size[1]}">
   <rect width="100%" height="100%" fill="{background_color}"/>
+  <g stroke="{stroke_color}" stroke-width="{stroke_width}" stroke-dasharray="{dash_len}" stroke-dashoffset="{dash_offset:.2f}">
 {paths_str}
+  </g>
 </svg>"""
 
             frames.append(svg)
@@ -3,7 +3,7 @@ Path utilities for Kivg.
 Contains functions for SVG path manipulation and coordinate transformation.
 """
 
-from typing import Tuple, List, Union, Callable
+from typing import Tuple, List, Optional, Union, Callable, Iterable
 import math
 from svg.path.path import Line, CubicBezier
 
@@ -71,14 +71,77 @@ def transform_point(
     Returns:
         [x, y] transformed coordinates
     """
+    affine = precompute_affine(target_size, target_pos, svg_size, flip_y)
+    return transform_point_fast(complex_point, affine)
+
+
+def precompute_affine(
+    target_size: Tuple[float, float],
+    target_pos: Tuple[float, float],
+    svg_size: Tuple[float, float],
+    flip_y: bool = True,
+) -> Tuple[float, float, float, float]:
+    """
+    Precompute the SVG to target affine transform.
+
+    The scale factors are invariant for every point of a given SVG, so
+    computing them once lets callers transform many points with only
+    multiplications and additions.
+
+    Args:
+        target_size: (width, height) of target
+        target_pos: (x, y) of target
+        svg_size: (width, height) of SVG
+        flip_y: Whether to flip the Y axis
+
+    Returns:
+        Tuple (origin_x, origin_y, scale_x, scale_y)
+    """
     w, h = target_size
     tx, ty = target_pos
     sw, sh = svg_size
 
-    return [
-        transform_x(complex_point.real, tx, w, sw),
-        transform_y(complex_point.imag, ty, h, sh, flip_y),
-    ]
+    if flip_y:
+        return (tx, ty + h, w / sw, -h / sh)
+    return (tx, ty, w / sw, h / sh)
+
+
+def transform_point_fast(
+    complex_point: complex, affine: Tuple[float, float, float, float]
+) -> List[float]:
+    """
+    Transform a complex point using a precomputed affine transform.
+
+    Args:
+        complex_point: SVG point as complex number
+        affine: Transform returned by precompute_affine
+
+    Returns:
+        [x, y] transformed coordinates
+    """
+    ox, oy, sx, sy = affine
+    return [ox + complex_point.real * sx, oy + complex_point.imag * sy]
+
+
+def transform_points(
+    complex_points: Iterable[complex], affine: Tuple[float, float, float, float]
+) -> List[float]:
+    """
+    Transform several complex points using a precomputed affine transform.
+
+    Args:
+        complex_points: SVG points as complex numbers
+        affine: Transform returned by precompute_affine
+
+    Returns:
+        Flattened list of transformed points [x1, y1, x2, y2, ...]
+    """
+    ox, oy, sx, sy = affine
+    points = []
+    for point in complex_points:
+        points.append(ox + point.real * sx)
+        points.append(oy + point.imag * sy)
+    return points
 
 
 def bezier_points(
@@ -87,6 +150,7 @@ def bezier_points(
     target_pos: Tuple[float, float],
     svg_size: Tuple[float, float],
     flip_y: bool = True,
+    affine: Optional[Tuple[float, float, float, float]] = None,
 ) -> List[float]:
     """
     Convert a CubicBezier to target-compatible bezier points.
@@ -97,16 +161,17 @@ def bezier_points(
         target_pos: (x, y) of target
         svg_size: (width, height) of SVG
         flip_y: Whether to flip the Y axis
+        affine: Transform from precompute_affine for these settings; pass it
+            when converting many segments to compute it once per SVG
 
     Returns:
         List of points [x1, y1, cx1, cy1, cx2, cy2, x2, y2]
     """
-    return [
-        *transform_point(bezier.start, target_size, target_pos, svg_size, flip_y),
-        *transform_point(bezier.control1, target_size, target_pos, svg_size, flip_y),
-        *transform_point(bezier.control2, target_size, target_pos, svg_size, flip_y),
-        *transform_point(bezier.end, target_size, target_pos, svg_size, flip_y),
-    ]
+    if affine is None:
+        affine = precompute_affine(target_size, target_pos, svg_size, flip_y)
+    return transform_points(
+        (bezier.start, bezier.control1, bezier.control2, bezier.end), affine
+    )
 
 
 def line_points(
@@ -115,6 +180,7 @@ def line_points(
     target_pos: Tuple[float, float],
     svg_size: Tuple[float, float],
     flip_y: bool = True,
+    affine: Optional[Tuple[float, float, float, float]] = None,
 ) -> List[float]:
     """
     Convert a Line to target-compatible line points.
@@ -125,14 +191,15 @@ def line_points(
         target_pos: (x, y) of target
         svg_size: (width, height) of SVG
         flip_y: Whether to flip the Y axis
+        affine: Transform from precompute_affine for these settings; pass it
+            when converting many segments to compute it once per SVG
 
     Returns:
         List of points [x1, y1, x2, y2]
     """
-    return [
-        *transform_point(line.start, target_size, target_pos, svg_size, flip_y),
-        *transform_point(line.end, target_size, target_pos, svg_size, flip_y),
-    ]
+    if affine is None:
+        affine = precompute_affine(target_size, target_pos, svg_size, flip_y)
+    return transform_points((line.start, line.end), affine)
 
 
 # Bernstein polynomials for Bezier calculation
@@ -173,10 +240,12 @@ def get_all_points(
     t = 0
 
     while t <= 1:
+        # Evaluate each Bernstein weight once and share it between x and y
+        b0, b1, b2, b3 = B0_t(t), B1_t(t), B2_t(t), B3_t(t)
         points.extend(
             [
-                (B0_t(t) * ax) + (B1_t(t) * bx) + (B2_t(t) * cx) + (B3_t(t) * dx),
-                (B0_t(t) * ay) + (B1_t(t) * by) + (B2_t(t) * cy) + (B3_t(t) * dy),
+                (b0 * ax) + (b1 * bx) + (b2 * cx) + (b3 * dx),
+                (b0 * ay) + (b1 * by) + (b2 * cy) + (b3 * dy),
             ]
         )
         t += seg
@@ -3,8 +3,20 @@ SVG parsing utilities for Kivg.
 Handles parsing SVG files and extracting path data.
 """
 
-from typing import Tuple, List, Dict, Any
-from xml.dom import minidom
+import re
+import xml.etree.ElementTree as ET
+from typing import IO, Tuple, List, Dict, Any, Union
+
+# SVG number token (handles signs, leading dots and exponents)
+_NUMBER_RE = re.compile(r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+
+# SVG element tags, with and without the SVG namespace
+_SVG_NS = "{http://www.w3.org/2000/svg}"
+_SVG_TAGS = ("svg", _SVG_NS + "svg")
+_PATH_TAGS = ("path", _SVG_NS + "path")
+
+# Color channel byte (0-255) to float (0.0-1.0) lookup table
+_CHANNEL_LUT = [i / 255.0 for i in range(256)]
 
 
 def get_color_from_hex(hex_color: str) -> List[float]:
@@ -37,66 +49,87 @@ def get_color_from_hex(hex_color: str) -> List[float]:
     elif len(hex_color) == 4:
         hex_color = "".join([c * 2 for c in hex_color])
 
-    # Parse the color components
-    if len(hex_color) == 6:
-        r = int(hex_color[0:2], 16) / 255.0
-        g = int(hex_color[2:4], 16) / 255.0
-        b = int(hex_color[4:6], 16) / 255.0
-        return [r, g, b, 1.0]
-    elif len(hex_color) == 8:
-        r = int(hex_color[0:2], 16) / 255.0
-        g = int(hex_color[2:4], 16) / 255.0
-        b = int(hex_color[4:6], 16) / 255.0
-        a = int(hex_color[6:8], 16) / 255.0
-        return [r, g, b, a]
-    else:
-        raise ValueError(
-            f"Invalid hex color format: '{hex_color}'. "
-            "Valid formats: '#fff', '#ffffff', '#ffffffff' (with or without #)"
-        )
-
-
-def parse_svg(svg_file: str) -> Tuple[List[float], List[Tuple[str, str, List[float]]]]:
+    # Parse the color components in one C-level pass and map each byte
+    # through the lookup table
+    try:
+        channels = bytes.fromhex(hex_color)
+    except ValueError:
+        channels = b""
+
+    # bytes.fromhex skips whitespace, so also check nothing was dropped
+    if len(channels) * 2 == len(hex_color):
+        if len(channels) == 3:
+            return [_CHANNEL_LUT[c] for c in channels] + [1.0]
+        if len(channels) == 4:
+            return [_CHANNEL_LUT[c] for c in channels]
+
+    raise ValueError(
+        f"Invalid hex color format: '{hex_color}'. "
+        "Valid formats: '#fff', '#ffffff', '#ffffffff' (with or without #)"
+    )
+
+
+def parse_svg(
+    svg_file: Union[str, IO],
+) -> Tuple[List[float], List[Tuple[str, str, List[float]]]]:
     """
     Parse an SVG file and extract relevant information.
 
     Args:
-        svg_file: Path to the SVG file
+        svg_file: Path to the SVG file, or a file-like object with SVG content
 
     Returns:
         Tuple containing (svg_dimensions, path_data)
             - svg_dimensions: [width, height]
             - path_data: List of tuples (path_string, element_id, color)
     """
+    viewbox_string = None
+    path_count = 0
+    path_strings = []
+
+    # Stream the document and detach each element from its parent once it
+    # ends. iterparse feeds the parser in chunks and attaches every element
+    # in a chunk before yielding its events, so a parent can still hold a
+    # chunk's worth of siblings; memory is bounded by the chunk size plus the
+    # nesting depth rather than by the document size.
+    open_elements = []
     try:
-        doc = minidom.parse(svg_file)
+        for event, elem in ET.iterparse(svg_file, events=("start", "end")):
+            if event == "end":
+                open_elements.pop()
+                if open_elements:
+                    open_elements[-1].remove(elem)
+                continue
+
+            open_elements.append(elem)
+
+            # Extract viewBox from the outermost <svg> element
+            if elem.tag in _SVG_TAGS:
+                if viewbox_string is None:
+                    viewbox_string = elem.get("viewBox", "")
+                continue
+
+            if elem.tag not in _PATH_TAGS:
+                continue
+
+            # Extract path data
+            id_ = elem.get("id") or f"path_{path_count}"
+            d = elem.get("d", "")
+            try:
+                fill_attr = elem.get("fill")
+                clr = get_color_from_hex(fill_attr) if fill_attr else [1, 1, 1, 0]
+            except ValueError:
+                clr = [1, 1, 1, 0]  # Default if color format is different
+
+            path_strings.append((d, id_, clr))
+            path_count += 1
     except Exception as e:
         raise ValueError(f"Failed to parse SVG file '{svg_file}': {e}")
 
-    # Extract viewBox
-    svg_element = doc.getElementsByTagName("svg")[0]
-    viewbox_string = svg_element.getAttribute("viewBox")
+    if viewbox_string is None:
+        raise ValueError(f"Failed to parse SVG file '{svg_file}': no <svg> element")
 
-    # Parse viewBox dimensions
-    if "," in viewbox_string:
-        sw_size = list(map(float, viewbox_string.split(",")[2:]))
-    else:
-        sw_size = list(map(float, viewbox_string.split(" ")[2:]))
+    # Parse viewBox dimensions (separated by any mix of commas and whitespace)
+    sw_size = list(map(float, _NUMBER_RE.findall(viewbox_string)[2:]))
 
-    # Extract path data
-    path_count = 0
-    path_strings = []
-    for path in doc.getElementsByTagName("path"):
-        id_ = path.getAttribute("id") or f"path_{path_count}"
-        d = path.getAttribute("d")
-        try:
-            fill_attr = path.getAttribute("fill")
-            clr = get_color_from_hex(fill_attr) if fill_attr else [1, 1, 1, 0]
-        except ValueError:
-            clr = [1, 1, 1, 0]  # Default if color format is different
-
-        path_strings.append((d, id_, clr))
-        path_count += 1
-
-    doc.unlink()
     return sw_size, path_strings
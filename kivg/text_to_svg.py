@@ -3,17 +3,221 @@ Text to SVG conversion for Kivg.
 Converts text to SVG paths for handwriting-style animation.
 """
 
+import functools
 import io
 import re
-import xml.parsers.expat
+import threading
+import xml.etree.ElementTree as ET
 from typing import List, Tuple, Dict, Any, Optional
-from xml.dom import minidom
 
 try:
     import cairocffi as cairo
+
+    # Built once at import time instead of on every font selection
+    _CAIRO_FONT_SLANTS = {
+        "normal": cairo.FONT_SLANT_NORMAL,
+        "italic": cairo.FONT_SLANT_ITALIC,
+        "oblique": cairo.FONT_SLANT_OBLIQUE,
+    }
+    _CAIRO_FONT_WEIGHTS = {
+        "normal": cairo.FONT_WEIGHT_NORMAL,
+        "bold": cairo.FONT_WEIGHT_BOLD,
+    }
+    _CAIRO_PATH_COMMANDS = {
+        cairo.PATH_MOVE_TO: "M",
+        cairo.PATH_LINE_TO: "L",
+        cairo.PATH_CURVE_TO: "C",
+        cairo.PATH_CLOSE_PATH: "Z",
+    }
 except ImportError:
     cairo = None
 
+_SVG_PATH_TAG = "{http://www.w3.org/2000/svg}path"
+
+# Cairo font faces keyed by (family, slant, weight), shared across converters
+_FONT_FACE_CACHE: Dict[Tuple[str, str, str], Any] = {}
+
+# Measurement context created on first use and reused for every measurement
+_measure_ctx = None
+_measure_font_key = None
+_measure_lock = threading.Lock()
+
+
+def _get_font_face(
+    font_family: str, font_slant: str, font_weight: str
+) -> "cairo.ToyFontFace":
+    """
+    Get a cached Cairo font face.
+
+    Args:
+        font_family: Font family name
+        font_slant: Font slant ("normal", "italic", or "oblique")
+        font_weight: Font weight ("normal" or "bold")
+
+    Returns:
+        Cairo font face shared by all converters using these settings
+    """
+    key = (font_family, font_slant, font_weight)
+    font_face = _FONT_FACE_CACHE.get(key)
+    if font_face is None:
+        font_face = cairo.ToyFontFace(
+            font_family,
+            _CAIRO_FONT_SLANTS.get(font_slant, cairo.FONT_SLANT_NORMAL),
+            _CAIRO_FONT_WEIGHTS.get(font_weight, cairo.FONT_WEIGHT_NORMAL),
+        )
+        _FONT_FACE_CACHE[key] = font_face
+    return font_face
+
+
+def _cairo_path_to_d(
+    path: List[Tuple[int, Tuple[float, ...]]], precision: int = 1
+) -> str:
+    """
+    Convert a Cairo path to compact SVG path data.
+
+    Coordinates are rounded to the given number of decimals. Axis-aligned
+    lines are written as H/V and a move that is immediately followed by
+    another move (Cairo emits one after every close) is dropped, since
+    neither changes the drawn outline.
+
+    Args:
+        path: Path records as returned by Context.copy_path()
+        precision: Number of decimals kept for each coordinate
+
+    Returns:
+        SVG path data string (e.g. "M10 20 H30 V40.5 Z")
+    """
+    def fmt(value: float) -> str:
+        # Fixed-point keeps every requested decimal even for large values;
+        # trailing zeros are dropped so whole numbers stay short
+        text = f"{value:.{precision}f}"
+        return text.rstrip("0").rstrip(".") if "." in text else text
+
+    commands = []
+    pending_move = None
+    current = start = (0.0, 0.0)
+
+    for operation, points in path:
+        # Adding 0.0 turns -0.0 into 0.0 so it is not written as "-0"
+        points = tuple(round(value, precision) + 0.0 for value in points)
+
+        if operation == cairo.PATH_MOVE_TO:
+            pending_move = current = start = points
+            continue
+
+        if pending_move is not None:
+            commands.append("M" + " ".join(map(fmt, pending_move)))
+            pending_move = None
+
+        if operation == cairo.PATH_LINE_TO:
+            x, y = points
+            if y == current[1]:
+                commands.append("H" + fmt(x))
+            elif x == current[0]:
+                commands.append("V" + fmt(y))
+            else:
+                commands.append(f"L{fmt(x)} {fmt(y)}")
+            current = points
+        elif operation == cairo.PATH_CLOSE_PATH:
+            commands.append("Z")
+            current = start
+        else:
+            commands.append(
+                _CAIRO_PATH_COMMANDS[operation]
+                + " ".join(map(fmt, points))
+            )
+            current = points[-2:]
+
+    return " ".join(commands)
+
+
+@functools.lru_cache(maxsize=1024)
+def _outline_path_data(
+    font_family: str,
+    font_slant: str,
+    font_weight: str,
+    font_size: float,
+    text: str,
+    x: float,
+    y: float,
+    precision: int = 1,
+) -> str:
+    """
+    Outline text with Cairo (memoized per font, text, position and precision).
+
+    Outlining dominates text conversion and the same strings are typically
+    converted repeatedly (e.g. previews, several exports), so every
+    converter with the same font settings shares the result.
+
+    Args:
+        font_family: Font family name
+        font_slant: Font slant ("normal", "italic", or "oblique")
+        font_weight: Font weight ("normal" or "bold")
+        font_size: Font size in points
+        text: The text to outline
+        x: X position for the text
+        y: Y position for the text baseline
+        precision: Number of decimals kept for each coordinate
+
+    Returns:
+        SVG path data string for the text outline
+    """
+    # Only the path geometry is needed, so no pixels are allocated
+    surface = cairo.RecordingSurface(cairo.CONTENT_ALPHA, None)
+    ctx = cairo.Context(surface)
+
+    # Set font
+    ctx.set_font_face(_get_font_face(font_family, font_slant, font_weight))
+    ctx.set_font_size(font_size)
+
+    # Convert text to path
+    ctx.move_to(x, y)
+    ctx.text_path(text)
+    d = _cairo_path_to_d(ctx.copy_path(), precision)
+
+    surface.finish()
+    return d
+
+
+@functools.lru_cache(maxsize=1024)
+def _measure_text_advance(
+    font_family: str, font_slant: str, font_weight: str, font_size: float, text: str
+) -> float:
+    """
+    Measure the horizontal advance of text (memoized per font and text).
+
+    Args:
+        font_family: Font family name
+        font_slant: Font slant ("normal", "italic", or "oblique")
+        font_weight: Font weight ("normal" or "bold")
+        font_size: Font size in points
+        text: The text to measure
+
+    Returns:
+        The x advance of the rendered text in pixels
+    """
+    global _measure_ctx, _measure_font_key
+
+    with _measure_lock:
+        if _measure_ctx is None:
+            # Use RecordingSurface for efficient text measurement (doesn't allocate pixels)
+            surface = cairo.RecordingSurface(cairo.CONTENT_ALPHA, None)
+            _measure_ctx = cairo.Context(surface)
+
+        # Only re-apply the font when it differs from the previous measurement
+        font_key = (font_family, font_slant, font_weight, font_size)
+        if font_key != _measure_font_key:
+            _measure_ctx.set_font_face(
+                _get_font_face(font_family, font_slant, font_weight)
+            )
+            _measure_ctx.set_font_size(font_size)
+            _measure_font_key = font_key
+
+        # text_extents returns (x_bearing, y_bearing, width, height, x_advance, y_advance)
+        extents = _measure_ctx.text_extents(text)
+
+    return extents[4]  # x_advance is the 5th element
+
 
 class TextToSVG:
     """
@@ -35,6 +239,7 @@ class TextToSVG:
     TEXT_PADDING = 20  # Padding around text in pixels
     HEIGHT_MULTIPLIER = 1.5  # Multiplier for text height calculation
     DASH_LENGTH_MULTIPLIER = 50  # Multiplier for dash array calculation
+    COORD_PRECISION = 1  # Decimals kept for path coordinates
 
     def __init__(
         self,
@@ -63,23 +268,6 @@ class TextToSVG:
         self.font_slant = font_slant
         self.font_weight = font_weight
 
-    def _get_cairo_font_slant(self) -> int:
-        """Get the Cairo font slant constant."""
-        slant_map = {
-            "normal": cairo.FONT_SLANT_NORMAL,
-            "italic": cairo.FONT_SLANT_ITALIC,
-            "oblique": cairo.FONT_SLANT_OBLIQUE,
-        }
-        return slant_map.get(self.font_slant, cairo.FONT_SLANT_NORMAL)
-
-    def _get_cairo_font_weight(self) -> int:
-        """Get the Cairo font weight constant."""
-        weight_map = {
-            "normal": cairo.FONT_WEIGHT_NORMAL,
-            "bold": cairo.FONT_WEIGHT_BOLD,
-        }
-        return weight_map.get(self.font_weight, cairo.FONT_WEIGHT_NORMAL)
-
     def get_text_dimensions(self, text: str) -> Tuple[float, float]:
         """
         Calculate the dimensions needed to render the text.
@@ -90,26 +278,14 @@ class TextToSVG:
         Returns:
             Tuple of (width, height) in pixels
         """
-        # Use RecordingSurface for efficient text measurement (doesn't allocate pixels)
-        surface = cairo.RecordingSurface(cairo.CONTENT_ALPHA, None)
-        ctx = cairo.Context(surface)
-
-        ctx.select_font_face(
-            self.font_family,
-            self._get_cairo_font_slant(),
-            self._get_cairo_font_weight(),
+        x_advance = _measure_text_advance(
+            self.font_family, self.font_slant, self.font_weight, self.font_size, text
         )
-        ctx.set_font_size(self.font_size)
-
-        # text_extents returns (x_bearing, y_bearing, width, height, x_advance, y_advance)
-        extents = ctx.text_extents(text)
-        x_advance = extents[4]  # x_advance is the 5th element
 
         # Add padding around text
         width = x_advance + self.TEXT_PADDING
         height = self.font_size * self.HEIGHT_MULTIPLIER + self.TEXT_PADDING
 
-        surface.finish()
         return (width, height)
 
     def text_to_svg_paths(
@@ -135,39 +311,89 @@ class TextToSVG:
         Returns:
             SVG content string with path elements
         """
+        svg_content, _ = self._render_svg(
+            text, x, y, stroke_color, stroke_width, fill_color
+        )
+        return svg_content
+
+    def _outline_text(
+        self,
+        text: str,
+        x: float = 10.0,
+        y: float = None,
+    ) -> Tuple[str, Tuple[float, float]]:
+        """
+        Outline text with Cairo and return it as SVG path data.
+
+        The glyph outlines are read back with copy_path, which avoids
+        stroking them and serializing through Cairo's SVG backend.
+
+        Args:
+            text: The text to convert
+            x: X position for the text
+            y: Y position for the text baseline (if None, calculated automatically)
+
+        Returns:
+            Tuple of (path_data, (width, height))
+        """
         # Calculate dimensions
         width, height = self.get_text_dimensions(text)
 
         if y is None:
             y = height - 10  # Position baseline near bottom with padding
 
-        # Create SVG surface
-        svg_io = io.BytesIO()
-        surface = cairo.SVGSurface(svg_io, width, height)
-        ctx = cairo.Context(surface)
-
-        # Set font
-        ctx.select_font_face(
+        d = _outline_path_data(
             self.font_family,
-            self._get_cairo_font_slant(),
-            self._get_cairo_font_weight(),
+            self.font_slant,
+            self.font_weight,
+            self.font_size,
+            text,
+            x,
+            y,
+            self.COORD_PRECISION,
         )
-        ctx.set_font_size(self.font_size)
+        return d, (width, height)
+
+    def _render_svg(
+        self,
+        text: str,
+        x: float = 10.0,
+        y: float = None,
+        stroke_color: str = "#000000",
+        stroke_width: float = 2.0,
+        fill_color: str = "none",
+    ) -> Tuple[str, Tuple[float, float]]:
+        """
+        Render text to SVG content.
 
-        # Convert text to path
-        ctx.move_to(x, y)
-        ctx.text_path(text)
+        Args:
+            text: The text to convert
+            x: X position for the text
+            y: Y position for the text baseline (if None, calculated automatically)
+            stroke_color: Stroke color for the paths
+            stroke_width: Stroke width for the paths
+            fill_color: Fill color for the paths (use "none" for outline only)
 
-        # Set stroke properties
-        ctx.set_line_width(stroke_width)
-        ctx.stroke()
+        Returns:
+            Tuple of (svg_content, (width, height)) so callers can reuse the
+            dimensions computed for the render
+        """
+        d, (width, height) = self._outline_text(text, x, y)
 
-        surface.finish()
+        path_element = ""
+        if d:
+            path_element = (
+                f'  <path d="{d}" fill="{fill_color}" stroke="{stroke_color}" '
+                f'stroke-width="{stroke_width}"/>\n'
+            )
 
-        # Get SVG content
-        svg_content = svg_io.getvalue().decode("utf-8")
+        svg_content = f"""<?xml version="1.0" encoding="UTF-8"?>
+<svg xmlns="http://www.w3.org/2000/svg"
+     width="{width}" height="{height}"
+     viewBox="0 0 {width} {height}">
+{path_element}</svg>"""
 
-        return svg_content
+        return svg_content, (width, height)
 
     def extract_paths_from_svg(self, svg_content: str) -> List[Dict[str, Any]]:
         """
@@ -182,18 +408,20 @@ class TextToSVG:
         paths = []
 
         try:
-            doc = minidom.parseString(svg_content)
+            root = ET.fromstring(svg_content)
+
+            for path in root.iter():
+                # Match <path> with or without the SVG namespace
+                if path.tag != "path" and path.tag != _SVG_PATH_TAG:
+                    continue
 
-            for path in doc.getElementsByTagName("path"):
-                d = path.getAttribute("d")
-                fill = path.getAttribute("fill") or "none"
-                stroke = path.getAttribute("stroke") or "#000000"
+                d = path.get("d")
+                fill = path.get("fill") or "none"
+                stroke = path.get("stroke") or "#000000"
 
                 if d:  # Only include paths with path data
                     paths.append({"d": d, "fill": fill, "stroke": stroke})
-
-            doc.unlink()
-        except (xml.parsers.expat.ExpatError, ValueError) as e:
+        except (ET.ParseError, ValueError) as e:
             # Log parsing error but return empty paths rather than failing
             import warnings
 
@@ -220,11 +448,10 @@ class TextToSVG:
                 - svg_size: [width, height] of the SVG
                 - paths: List of path dictionaries
         """
-        svg_content = self.text_to_svg_paths(text, x, y)
-        paths = self.extract_paths_from_svg(svg_content)
-
-        # Extract viewBox dimensions
-        width, height = self.get_text_dimensions(text)
+        # Use the outline directly rather than serializing it to an SVG
+        # document and parsing the path data back out
+        d, (width, height) = self._outline_text(text, x, y)
+        paths = [{"d": d, "fill": "none", "stroke": "#000000"}] if d else []
 
         return [width, height], paths
 
@@ -267,27 +494,17 @@ class TextToSVG:
   <rect width="100%" height="100%" fill="{background_color}"/>
 </svg>"""
 
-        # Build path elements
-        path_elements = []
         # Calculate dash_length based on SVG width if not provided
         # Use DASH_LENGTH_MULTIPLIER to ensure it's larger than any character path
         calculated_dash_length = dash_length or int(
             svg_size[0] * self.DASH_LENGTH_MULTIPLIER
         )
 
-        for i, path_data in enumerate(paths):
-            d = path_data.get("d", "")
-            fill = fill_color if fill_after_draw else "none"
-
-            path_elements.append(
-                f'    <path id="text-path-{i}" d="{d}" '
-                f'fill="{fill}" stroke="{stroke_color}" '
-                f'stroke-width="{stroke_width}" class="animate-text"/>'
-            )
-
-        paths_str = "\n".join(path_elements)
-
-        svg = f"""<?xml version="1.0" encoding="UTF-8"?>
+        # Stream the document into a single buffer instead of joining the
+        # path elements first and then copying them into the template
+        buf = io.StringIO()
+        buf.write(
+            f"""<?xml version="1.0" encoding="UTF-8"?>
 <svg xmlns="http://www.w3.org/2000/svg"
      width="{svg_size[0]}" height="{svg_size[1]}"
      viewBox="0 0 {svg_size[0]} {svg_size[1]}">
@@ -305,8 +522,19 @@ class TextToSVG:
     }}
   </style>
   <rect width="100%" height="100%" fill="{background_color}"/>
-{paths_str}
-</svg>"""
+"""
+        )
+
+        fill = fill_color if fill_after_draw else "none"
+        for i, path_data in enumerate(paths):
+            buf.write(
+                f'    <path id="text-path-{i}" d="{path_data.get("d", "")}" '
+                f'fill="{fill}" stroke="{stroke_color}" '
+                f'stroke-width="{stroke_width}" class="animate-text"/>\n'
+            )
+
+        buf.write("</svg>")
+        svg = buf.getvalue()
 
         return svg
 
@@ -0,0 +1,28 @@
+"""
+Shared fixtures for Kivg tests.
+"""
+
+import pytest
+
+from kivg import parse_svg
+
+
+SAMPLE_SVG = """<?xml version="1.0" encoding="UTF-8"?>
+<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 100 100">
+  <path id="circle" d="M50 10 A40 40 0 1 1 49.99 10 Z" fill="#ff0000"/>
+  <path id="line" d="M10 50 L90 50" fill="#00ff00"/>
+</svg>"""
+
+
+@pytest.fixture(scope="session")
+def parsed_sample_svg(tmp_path_factory):
+    """Write the sample SVG once per session and parse it once.
+
+    Returns:
+        Tuple of (path, svg_size, paths)
+    """
+    path = tmp_path_factory.mktemp("svg") / "sample.svg"
+    path.write_text(SAMPLE_SVG)
+
+    svg_size, paths = parse_svg(str(path))
+    return str(path), svg_size, paths
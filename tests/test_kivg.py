@@ -3,46 +3,65 @@ Unit tests for Kivg library.
 """
 
 import pytest
-import tempfile
+import io
 import os
+import weakref
+
+from svg.path.path import CubicBezier, Line
+
+import kivg.main
+from kivg import (
+    SVGAnimator,
+    TextToSVG,
+    WebAnimationExporter,
+    create_text_animation,
+    parse_svg,
+    text_to_svg,
+)
+from kivg.animation import AnimationTransition
+from kivg.path_utils import (
+    bezier_points,
+    get_all_points,
+    line_points,
+    precompute_affine,
+    transform_point_fast,
+    transform_points,
+    transform_x,
+    transform_y,
+)
+from kivg.svg_parser import get_color_from_hex
+from kivg.text_to_svg import _cairo_path_to_d, _outline_path_data, cairo
+
+# Every easing function exposed by AnimationTransition
+EASING_NAMES = sorted(
+    name
+    for name, attr in vars(AnimationTransition).items()
+    if isinstance(attr, staticmethod) and not name.startswith("_")
+)
+
+# Progress values sampled across the whole 0-1 domain
+PROGRESS_SAMPLES = [i / 100.0 for i in range(101)]
+
+
+def assert_all_in(text, *needles):
+    """Assert that every needle occurs in text, reporting all that are missing."""
+    missing = [needle for needle in needles if needle not in text]
+    assert not missing, f"missing from output: {missing}"
 
 
 class TestSVGParser:
     """Tests for SVG parsing functionality."""
 
-    @pytest.fixture
-    def sample_svg_content(self):
-        """Create sample SVG content."""
-        return """<?xml version="1.0" encoding="UTF-8"?>
-<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 100 100">
-  <path id="circle" d="M50 10 A40 40 0 1 1 49.99 10 Z" fill="#ff0000"/>
-  <path id="line" d="M10 50 L90 50" fill="#00ff00"/>
-</svg>"""
-
-    @pytest.fixture
-    def sample_svg_file(self, sample_svg_content):
-        """Create a temporary SVG file."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".svg", delete=False) as f:
-            f.write(sample_svg_content)
-            return f.name
-
-    def test_parse_svg(self, sample_svg_file):
+    def test_parse_svg(self, parsed_sample_svg):
         """Test parsing an SVG file."""
-        from kivg import parse_svg
-
-        svg_size, paths = parse_svg(sample_svg_file)
+        _, svg_size, paths = parsed_sample_svg
 
         assert svg_size == [100.0, 100.0]
         assert len(paths) == 2
 
-        # Clean up
-        os.unlink(sample_svg_file)
-
-    def test_parse_svg_colors(self, sample_svg_file):
+    def test_parse_svg_colors(self, parsed_sample_svg):
         """Test that colors are parsed correctly."""
-        from kivg import parse_svg
-
-        svg_size, paths = parse_svg(sample_svg_file)
+        _, svg_size, paths = parsed_sample_svg
 
         # First path should be red (#ff0000)
         circle_color = paths[0][2]
@@ -56,80 +75,116 @@ class TestSVGParser:
         assert line_color[1] == 1.0  # Green
         assert line_color[2] == 0.0  # Blue
 
-        # Clean up
-        os.unlink(sample_svg_file)
+    def test_parse_svg_viewbox_separators(self):
+        """Test parsing a viewBox with mixed comma/whitespace separators."""
+        content = """<?xml version="1.0" encoding="UTF-8"?>
+<svg xmlns="http://www.w3.org/2000/svg" viewBox="0, 0  120.5
+  1e2">
+  <path id="line" d="M10 50 L90 50" fill="#00ff00"/>
+</svg>"""
+        svg_size, paths = parse_svg(io.StringIO(content))
+        assert svg_size == [120.5, 100.0]
 
 
 class TestColorConversion:
     """Tests for hex color conversion."""
 
-    def test_hex_color_6_digits(self):
-        """Test converting 6-digit hex colors."""
-        from kivg.svg_parser import get_color_from_hex
-
-        color = get_color_from_hex("#ff0000")
-        assert color == [1.0, 0.0, 0.0, 1.0]
-
-        color = get_color_from_hex("#00ff00")
-        assert color == [0.0, 1.0, 0.0, 1.0]
-
-        color = get_color_from_hex("#0000ff")
-        assert color == [0.0, 0.0, 1.0, 1.0]
-
-    def test_hex_color_3_digits(self):
-        """Test converting 3-digit shorthand hex colors."""
-        from kivg.svg_parser import get_color_from_hex
-
-        color = get_color_from_hex("#f00")
-        assert color == [1.0, 0.0, 0.0, 1.0]
-
-        color = get_color_from_hex("#0f0")
-        assert color == [0.0, 1.0, 0.0, 1.0]
-
-    def test_hex_color_8_digits(self):
-        """Test converting 8-digit hex colors with alpha."""
-        from kivg.svg_parser import get_color_from_hex
-
-        color = get_color_from_hex("#ff000080")
-        assert color[0] == 1.0
-        assert color[1] == 0.0
-        assert color[2] == 0.0
-        assert abs(color[3] - 0.502) < 0.01  # ~50% alpha
+    @pytest.mark.parametrize(
+        "hex_in, expected",
+        [
+            # 6-digit colors
+            ("#ff0000", [1.0, 0.0, 0.0, 1.0]),
+            ("#00ff00", [0.0, 1.0, 0.0, 1.0]),
+            ("#0000ff", [0.0, 0.0, 1.0, 1.0]),
+            # 3-digit shorthand
+            ("#f00", [1.0, 0.0, 0.0, 1.0]),
+            ("#0f0", [0.0, 1.0, 0.0, 1.0]),
+            # 8-digit with alpha (~50%)
+            ("#ff000080", [1.0, 0.0, 0.0, 0.502]),
+            # Without # prefix
+            ("ff0000", [1.0, 0.0, 0.0, 1.0]),
+        ],
+    )
+    def test_hex_color(self, hex_in, expected):
+        """Test converting hex colors to RGBA values."""
+        assert get_color_from_hex(hex_in) == pytest.approx(expected, abs=0.01)
+
+    def test_hex_color_invalid(self):
+        """Test that malformed hex colors raise ValueError."""
+        for hex_color in ("#12345", "#gggggg", "#ff 00 ", ""):
+            with pytest.raises(ValueError):
+                get_color_from_hex(hex_color)
+
+
+class TestPathUtils:
+    """Tests for path transformation utilities."""
+
+    def test_transform_point_fast_matches_transform(self):
+        """Test that the precomputed affine matches per-axis transforms."""
+        for flip_y in (True, False):
+            affine = precompute_affine((400, 300), (10, 20), (100, 50), flip_y)
+            x, y = transform_point_fast(25 + 10j, affine)
+
+            assert x == pytest.approx(transform_x(25, 10, 400, 100))
+            assert y == pytest.approx(transform_y(10, 20, 300, 50, flip_y))
+
+    def test_transform_points(self):
+        """Test transforming several points into a flat coordinate list."""
+        affine = precompute_affine((200, 200), (0, 0), (100, 100), flip_y=False)
+        points = transform_points([0j, 10 + 20j, 100 + 100j], affine)
+
+        assert points == pytest.approx([0, 0, 20, 40, 200, 200])
+
+    def test_segment_points_accept_precomputed_affine(self):
+        """Test that line/bezier conversion reuses a precomputed affine."""
+        args = ((400, 300), (10, 20), (100, 50))
+        affine = precompute_affine(*args)
+        line = Line(start=0j, end=100 + 50j)
+        bezier = CubicBezier(start=0j, control1=10j, control2=10 + 10j, end=10 + 0j)
+
+        assert line_points(line, *args, affine=affine) == line_points(line, *args)
+        assert bezier_points(bezier, *args, affine=affine) == (
+            bezier_points(bezier, *args)
+        )
+        assert line_points(line, *args) == pytest.approx([10, 320, 410, 20])
 
-    def test_hex_color_without_hash(self):
-        """Test converting hex colors without # prefix."""
-        from kivg.svg_parser import get_color_from_hex
+    def test_get_all_points(self):
+        """Test sampling points along a cubic bezier curve."""
+        points = get_all_points((0, 0), (0, 10), (10, 10), (10, 0), segments=4)
 
-        color = get_color_from_hex("ff0000")
-        assert color == [1.0, 0.0, 0.0, 1.0]
+        assert len(points) % 2 == 0
+        assert points[:2] == [0, 0]
+        # Symmetric curve peaks at its midpoint
+        assert points[4:6] == pytest.approx([5.0, 7.5])
 
 
 class TestSVGAnimator:
     """Tests for SVGAnimator class."""
 
     @pytest.fixture
-    def sample_svg_file(self):
+    def sample_svg_file(self, tmp_path):
         """Create a temporary SVG file."""
         content = """<?xml version="1.0" encoding="UTF-8"?>
 <svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 100 100">
   <path id="test" d="M10 10 L90 90" fill="#ff0000"/>
 </svg>"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".svg", delete=False) as f:
-            f.write(content)
-            return f.name
+        path = tmp_path / "sample.svg"
+        path.write_text(content)
+        return str(path)
 
     def test_create_animator(self):
         """Test creating an SVGAnimator instance."""
-        from kivg import SVGAnimator
-
         animator = SVGAnimator(width=800, height=600)
         assert animator.width == 800
         assert animator.height == 600
 
+    def test_animator_is_weak_referenceable(self):
+        """Test that SVGAnimator instances support weak references."""
+        animator = SVGAnimator()
+        assert weakref.ref(animator)() is animator
+
     def test_load_svg(self, sample_svg_file):
         """Test loading an SVG file."""
-        from kivg import SVGAnimator
-
         animator = SVGAnimator()
         info = animator.load_svg(sample_svg_file)
 
@@ -137,13 +192,49 @@ class TestSVGAnimator:
         assert "shapes" in info
         assert "path_count" in info
 
-        # Clean up
-        os.unlink(sample_svg_file)
+    def test_load_svg_reuses_unchanged_file(self, sample_svg_file, monkeypatch):
+        """Test that reloading an unchanged file skips re-parsing."""
+        calls = []
+
+        def counting_parse_svg(svg_file):
+            calls.append(svg_file)
+            return parse_svg(svg_file)
+
+        monkeypatch.setattr(kivg.main, "parse_svg", counting_parse_svg)
+
+        animator = SVGAnimator()
+        first = animator.load_svg(sample_svg_file)
+        assert animator.load_svg(sample_svg_file) == first
+        assert len(calls) == 1
+
+        # Touching the file invalidates the cached parse
+        stat = os.stat(sample_svg_file)
+        os.utime(sample_svg_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**10))
+        animator.load_svg(sample_svg_file)
+        assert len(calls) == 2
+
+        # So does a rewrite that changes the size but keeps the mtime
+        stat = os.stat(sample_svg_file)
+        with open(sample_svg_file, "a") as f:
+            f.write("\n")
+        os.utime(sample_svg_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        animator.load_svg(sample_svg_file)
+        assert len(calls) == 3
+
+    def test_load_svg_returns_fresh_data(self, sample_svg_file):
+        """Test that mutating a returned result does not leak into reloads."""
+        animator = SVGAnimator()
+        info = animator.load_svg(sample_svg_file)
+        info["shapes"].pop("test")
+        info["svg_size"].append(0.0)
+
+        info = animator.load_svg(sample_svg_file)
+        assert "test" in info["shapes"]
+        assert info["svg_size"] == [100.0, 100.0]
+        assert len(animator.get_paths()) == 1
 
     def test_get_paths(self, sample_svg_file):
         """Test getting paths from loaded SVG."""
-        from kivg import SVGAnimator
-
         animator = SVGAnimator()
         animator.load_svg(sample_svg_file)
 
@@ -153,8 +244,26 @@ class TestSVGAnimator:
         assert "d" in paths[0]
         assert "fill" in paths[0]
 
-        # Clean up
-        os.unlink(sample_svg_file)
+    def test_generate_animation_frames_keeps_path_fills(self):
+        """Test that every path keeps its own fill, in document order."""
+        content = """<?xml version="1.0" encoding="UTF-8"?>
+<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 100 100">
+  <path id="a" d="M10 10 L90 10" fill="#ff0000"/>
+  <path id="b" d="M10 20 L90 20" fill="#00ff00"/>
+  <path id="c" d="M10 30 L90 30" fill="#ff0000"/>
+</svg>"""
+        animator = SVGAnimator()
+        animator.load_svg(io.StringIO(content))
+        frames = animator.generate_animation_frames(num_frames=2)
+
+        assert len(frames) == 2
+        assert frames[0].count("<path ") == 3
+        assert frames[0].index('<path d="M10 10 L90 10" fill="#ff0000" />') < (
+            frames[0].index('<path d="M10 20 L90 20" fill="#00ff00" />')
+        ) < frames[0].index('<path d="M10 30 L90 30" fill="#ff0000" />')
+
+        unfilled = animator.generate_animation_frames(num_frames=1, fill=False)
+        assert unfilled[0].count('fill="none"') == 3
 
 
 class TestWebExporter:
@@ -162,42 +271,30 @@ class TestWebExporter:
 
     def test_generate_css_animation(self):
         """Test generating CSS animation HTML."""
-        from kivg import WebAnimationExporter
-
         exporter = WebAnimationExporter(width=400, height=400)
         paths = [{"d": "M10 10 L90 90", "fill": "#ff0000"}]
 
         html = exporter.generate_css_animation(paths, duration=2.0)
 
-        assert "<!DOCTYPE html>" in html
-        assert "@keyframes draw" in html
-        assert "stroke-dasharray" in html
+        assert_all_in(html, "<!DOCTYPE html>", "@keyframes draw", "stroke-dasharray")
 
     def test_generate_js_animation(self):
         """Test generating JavaScript animation HTML."""
-        from kivg import WebAnimationExporter
-
         exporter = WebAnimationExporter(width=400, height=400)
         paths = [{"d": "M10 10 L90 90", "fill": "#ff0000"}]
 
         html = exporter.generate_js_animation(paths, duration=2.0)
 
-        assert "<!DOCTYPE html>" in html
-        assert "requestAnimationFrame" in html
-        assert "animatePaths" in html
+        assert_all_in(html, "<!DOCTYPE html>", "requestAnimationFrame", "animatePaths")
 
     def test_generate_svg_smil(self):
         """Test generating SMIL animation SVG."""
-        from kivg import WebAnimationExporter
-
         exporter = WebAnimationExporter(width=400, height=400)
         paths = [{"d": "M10 10 L90 90", "fill": "#ff0000"}]
 
         svg = exporter.generate_svg_smil(paths, duration=2.0)
 
-        assert '<?xml version="1.0"' in svg
-        assert "<animate" in svg
-        assert "stroke-dashoffset" in svg
+        assert_all_in(svg, '<?xml version="1.0"', "<animate", "stroke-dashoffset")
 
 
 class TestAnimationEasing:
@@ -205,32 +302,35 @@ class TestAnimationEasing:
 
     def test_linear(self):
         """Test linear easing."""
-        from kivg.animation import AnimationTransition
-
-        assert AnimationTransition.linear(0.0) == 0.0
-        assert AnimationTransition.linear(0.5) == 0.5
-        assert AnimationTransition.linear(1.0) == 1.0
+        assert [AnimationTransition.linear(t) for t in PROGRESS_SAMPLES] == (
+            PROGRESS_SAMPLES
+        )
 
     def test_out_quad(self):
         """Test quadratic ease-out."""
-        from kivg.animation import AnimationTransition
-
         assert AnimationTransition.out_quad(0.0) == 0.0
         assert AnimationTransition.out_quad(1.0) == 1.0
-        # out_quad should be faster at the start
-        assert AnimationTransition.out_quad(0.5) > 0.5
+        # out_quad should be ahead of linear everywhere in between
+        assert all(
+            AnimationTransition.out_quad(t) > t for t in PROGRESS_SAMPLES[1:-1]
+        )
+
+    @pytest.mark.parametrize("name", EASING_NAMES)
+    def test_endpoints(self, name):
+        """Test that every easing starts near 0 and ends at 1."""
+        func = AnimationTransition.get_transition(name)
+
+        # Elastic easings overshoot slightly at the start
+        assert func(0.0) == pytest.approx(0.0, abs=1e-3)
+        assert func(1.0) == pytest.approx(1.0)
 
     def test_in_bounce(self):
         """Test bounce ease-in."""
-        from kivg.animation import AnimationTransition
-
         assert AnimationTransition.in_bounce(0.0) == 0.0
         assert AnimationTransition.in_bounce(1.0) == 1.0
 
     def test_get_transition(self):
         """Test getting transition by name."""
-        from kivg.animation import AnimationTransition
-
         func = AnimationTransition.get_transition("out_bounce")
         assert func == AnimationTransition.out_bounce
 
@@ -244,8 +344,6 @@ class TestTextToSVG:
 
     def test_create_text_to_svg(self):
         """Test creating a TextToSVG instance."""
-        from kivg import TextToSVG
-
         converter = TextToSVG(
             font_family="sans-serif", font_size=40.0, font_weight="bold"
         )
@@ -255,8 +353,6 @@ class TestTextToSVG:
 
     def test_get_text_dimensions(self):
         """Test getting text dimensions."""
-        from kivg import TextToSVG
-
         converter = TextToSVG(font_size=40.0)
         width, height = converter.get_text_dimensions("Hello")
 
@@ -266,8 +362,6 @@ class TestTextToSVG:
 
     def test_text_to_path_data(self):
         """Test converting text to path data."""
-        from kivg import TextToSVG
-
         converter = TextToSVG(font_size=40.0)
         svg_size, paths = converter.text_to_path_data("Test")
 
@@ -276,22 +370,81 @@ class TestTextToSVG:
         assert svg_size[1] > 0  # height
         assert len(paths) >= 1  # At least one path should be created
 
+    def test_extract_paths_from_svg(self):
+        """Test extracting path data from namespaced SVG content."""
+        converter = TextToSVG()
+        paths = converter.extract_paths_from_svg(
+            '<svg xmlns="http://www.w3.org/2000/svg"><g>'
+            '<path d="M0 0 L10 10" fill="#ff0000"/><path d=""/>'
+            "</g></svg>"
+        )
+
+        assert paths == [{"d": "M0 0 L10 10", "fill": "#ff0000", "stroke": "#000000"}]
+
+    def test_cairo_path_to_d_compacts_lines(self):
+        """Test that axis-aligned lines and redundant moves are compacted."""
+        path = [
+            (cairo.PATH_MOVE_TO, (10.0, 20.0)),
+            (cairo.PATH_LINE_TO, (30.0, 20.0)),
+            (cairo.PATH_LINE_TO, (30.0, 40.5)),
+            (cairo.PATH_LINE_TO, (12.0, 41.0)),
+            (cairo.PATH_CLOSE_PATH, ()),
+            (cairo.PATH_MOVE_TO, (10.0, 20.0)),
+            (cairo.PATH_MOVE_TO, (50.0, 60.0)),
+            (cairo.PATH_CURVE_TO, (50.0, 65.0, 55.0, 70.0, 60.0, 70.0)),
+            (cairo.PATH_LINE_TO, (60.0, 80.0)),
+        ]
+
+        assert _cairo_path_to_d(path) == (
+            "M10 20 H30 V40.5 L12 41 Z M50 60 C50 65 55 70 60 70 V80"
+        )
+
+    def test_cairo_path_to_d_rounds_coordinates(self):
+        """Test that coordinates are rounded to the requested precision."""
+        path = [
+            (cairo.PATH_MOVE_TO, (10.04, -0.04)),
+            (cairo.PATH_LINE_TO, (30.26, 0.01)),
+        ]
+
+        assert _cairo_path_to_d(path) == "M10 0 H30.3"
+        assert _cairo_path_to_d(path, precision=2) == "M10.04 -0.04 L30.26 0.01"
+
+    def test_cairo_path_to_d_keeps_precision_for_large_values(self):
+        """Test that large coordinates are not cut to significant digits."""
+        path = [
+            (cairo.PATH_MOVE_TO, (123456.78, 20.0)),
+            (cairo.PATH_LINE_TO, (1234567.8, 40.0)),
+        ]
+
+        assert _cairo_path_to_d(path) == "M123456.8 20 L1234567.8 40"
+        assert _cairo_path_to_d(path, precision=2) == "M123456.78 20 L1234567.8 40"
+
+    def test_text_to_path_data_is_cached(self):
+        """Test that repeated conversions reuse the cached path data."""
+        _outline_path_data.cache_clear()
+
+        converter = TextToSVG(font_size=40.0)
+        first = converter.text_to_path_data("Cache")
+        second = converter.text_to_path_data("Cache")
+        assert first == second
+
+        # The second conversion is served from the outline cache
+        info = _outline_path_data.cache_info()
+        assert (info.misses, info.hits) == (1, 1)
+
+        # Mutating a returned result must not leak into the cache
+        first[1].clear()
+        assert converter.text_to_path_data("Cache")[1] == second[1]
+
     def test_text_to_svg_paths(self):
         """Test generating SVG content from text."""
-        from kivg import TextToSVG
-
         converter = TextToSVG(font_size=40.0)
         svg_content = converter.text_to_svg_paths("Hello")
 
-        assert "<?xml" in svg_content
-        assert "<svg" in svg_content
-        assert "<path" in svg_content
-        assert 'd="' in svg_content
+        assert_all_in(svg_content, "<?xml", "<svg", "<path", 'd="')
 
     def test_create_animated_text_svg(self):
         """Test creating animated text SVG."""
-        from kivg import TextToSVG
-
         converter = TextToSVG(font_size=40.0)
         svg = converter.create_animated_text_svg(
             "Hello",
@@ -300,34 +453,35 @@ class TestTextToSVG:
             stroke_width=2.0,
         )
 
-        assert "<?xml" in svg
-        assert "<svg" in svg
-        assert "@keyframes draw-text" in svg
-        assert "stroke-dasharray" in svg
-        assert "stroke-dashoffset" in svg
-        assert "animation" in svg
+        assert_all_in(
+            svg,
+            "<?xml",
+            "<svg",
+            "@keyframes draw-text",
+            "stroke-dasharray",
+            "stroke-dashoffset",
+            "animation",
+        )
 
     def test_create_text_animation_function(self):
         """Test the create_text_animation convenience function."""
-        from kivg import create_text_animation
-
         svg = create_text_animation(
             "Hello World", duration=3.0, font_size=50.0, stroke_color="#000000"
         )
 
-        assert "<?xml" in svg
-        assert "<svg" in svg
-        assert "@keyframes" in svg
-        assert "3.0s" in svg  # Duration should be in the animation
+        assert_all_in(
+            svg,
+            "<?xml",
+            "<svg",
+            "@keyframes",
+            "3.0s",  # Duration should be in the animation
+        )
 
     def test_text_to_svg_function(self):
         """Test the text_to_svg convenience function."""
-        from kivg import text_to_svg
-
         svg = text_to_svg("Test", font_size=30.0, font_weight="bold")
 
-        assert "<svg" in svg
-        assert "<path" in svg
+        assert_all_in(svg, "<svg", "<path")
 
 
 if __name__ == "__main__":